@@ -11,11 +11,57 @@ import serial
 import time
 import json
 import os
+import select
+import string
 import threading
+import queue
+from types import MappingProxyType
+from functools import reduce
+from operator import xor
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from datetime import datetime
 
+try:
+    import numpy as np  # Opcional: reducción XOR vectorizada para el checksum
+except ImportError:
+    np = None
+
+try:
+    # Opcional: extensión Cython (setup.py) con la separación de tramas, el checksum
+    # y los manejadores de tramas de formato fijo en C
+    from nmea_parser import NmeaParser, calcular_checksum as _checksum_c, procesar_trama as _procesar_c
+except ImportError:
+    NmeaParser = None
+    _checksum_c = None
+    _procesar_c = None
+
+# Dígitos hexadecimales válidos en el checksum (como enteros, al indexar bytes)
+_HEX = frozenset(string.hexdigits.encode('ascii'))
+
+
+def _f(valor, default=None):
+    """Convierte un campo a float; devuelve default si no es numérico"""
+    try:
+        return float(valor)
+    except (ValueError, TypeError):
+        return default
+
+
+def _i(valor, default=None):
+    """Convierte un campo a int; devuelve default si no es numérico"""
+    try:
+        return int(valor)
+    except (ValueError, TypeError):
+        return default
+
+
+def _texto(datos, clave):
+    """Texto de un dato GPS para la interfaz; '--' si falta o no se pudo interpretar (None)"""
+    valor = datos.get(clave)
+    return '--' if valor is None else str(valor)
+
+
 class GPSFusion:
     def __init__(self, puerto='/dev/serial0', baudrate=9600, timeout=1, debug=False):
         """Inicializa la conexión serial con el módem GPS"""
@@ -47,6 +93,22 @@ class GPSFusion:
         self.GPSFusion = None  # <- Previene AttributeError
         self.gps = None
         self.callback_actualizacion = None
+        self._rxbuf = bytearray()  # Bytes recibidos pendientes de completar una trama
+        self._parser = NmeaParser() if NmeaParser is not None else None
+        # Registros de satélites reutilizados en cada secuencia GSV: se rellena uno
+        # de los dos juegos mientras el otro sigue publicado en satelites_info
+        self._sat_slots = [{'id': '', 'elevacion': 0, 'azimut': 0, 'snr': 0} for _ in range(32)]
+        self._sat_slots_pub = [{'id': '', 'elevacion': 0, 'azimut': 0, 'snr': 0} for _ in range(32)]
+        self._sat_count = 0
+        # Vista de solo lectura de datos_gps para la UI (evita copiar el diccionario)
+        self._vista_datos = MappingProxyType(self.datos_gps)
+        self._last_cb = 0.0
+        self._cb_min_interval = 0.2  # Máximo 5 actualizaciones de UI por segundo
+        self._cb_pendiente = False  # Hay datos aún no notificados a la UI
+        
+        # Escritura del log en segundo plano: se abre al iniciar la lectura
+        self._logq = None
+        self._tramas_en_log = 0  # Valor de tramas_procesadas en el último log
         
     def definir_callback(self, callback):
         """Define una función de callback para actualizar la UI"""
@@ -72,10 +134,25 @@ class GPSFusion:
             return False
     
     def desconectar(self):
-        """Cierra la conexión serial"""
+        """Cierra la conexión serial y el archivo de log"""
         if self.conexion and self.conexion.is_open:
             self.conexion.close()
             print("Conexión cerrada")
+        if self._logq is not None:
+            self._logq.put_nowait(None)  # Cerrar el log cuando se vacíe la cola
+            self._logq = None
+
+    def _abrir_log(self):
+        """Abre el descriptor del log (una sola vez por lectura) y arranca su hilo"""
+        try:
+            fd = os.open(self.archivo_log, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError as e:
+            # Sin log la lectura continúa (guardar_log solo muestra los datos)
+            print(f"Error al abrir el log: {e}")
+            self._logq = None
+            return
+        self._logq = queue.Queue()
+        threading.Thread(target=self._log_worker, args=(fd, self._logq), daemon=True).start()
 
     def detener(self):
         if self.GPSFusion is not None:
@@ -84,42 +161,52 @@ class GPSFusion:
         else:
             print("GPSFusion no estaba en ejecución.")
     
+    def calcular_checksum_bytes(self, sentencia):
+        """Calcula el checksum (entero) de una sentencia NMEA en bytes"""
+        if _checksum_c is not None:
+            return _checksum_c(sentencia)
+        inicio = sentencia.index(b'$') + 1  # Omitir el $ inicial
+        fin = sentencia.find(b'*', inicio)
+        if fin < 0:
+            fin = len(sentencia)
+        carga = sentencia[inicio:fin]
+        # Para cargas cortas el coste de llamar a numpy supera al bucle en C
+        if np is None or len(carga) < 24:
+            return reduce(xor, carga, 0)
+        return int(np.bitwise_xor.reduce(np.frombuffer(carga, dtype=np.uint8)))
+    
     def calcular_checksum(self, sentencia):
         """Calcula el checksum de una sentencia NMEA"""
-        checksum = 0
-        for char in sentencia[1:]:  # Omitir el $ inicial
-            if char == '*':
-                break
-            checksum ^= ord(char)
-        return f"{checksum:02X}"  # Devuelve el checksum en hexadecimal
+        if isinstance(sentencia, str):
+            sentencia = sentencia.encode('ascii', errors='replace')
+        return f"{self.calcular_checksum_bytes(sentencia):02X}"  # Devuelve el checksum en hexadecimal
     
     def validar_checksum(self, sentencia):
-        """Valida el checksum de una sentencia NMEA"""
-        if '*' not in sentencia:
+        """Valida el checksum de una sentencia NMEA (en bytes)"""
+        fin = sentencia.find(b'*')
+        # Tras el '*' deben venir exactamente dos dígitos hexadecimales
+        if fin < 0 or len(sentencia) != fin + 3:
             return False
-        
-        partes = sentencia.split('*')
-        if len(partes) != 2:
+        hh = sentencia[fin + 1:]
+        if hh[0] not in _HEX or hh[1] not in _HEX:
             return False
+        checksum_recibido = int(hh, 16)
         
-        checksum_calculado = self.calcular_checksum(sentencia)
-        checksum_recibido = partes[1].strip().upper()
-        
-        return checksum_calculado == checksum_recibido
+        return self.calcular_checksum_bytes(sentencia) == checksum_recibido
     
-    def convertir_a_decimal(self, coordenada_str):
+    def convertir_a_decimal(self, coordenada_str, direccion=None):
         """
-        Convierte una coordenada NMEA en formato ddmm.mmmm a grados decimales.
+        Convierte una coordenada NMEA en formato (d)ddmm.mmmm a grados decimales.
         Por ejemplo: 0215.87414 -> 2 + (15.87414 / 60) = 2.26457
+        Las direcciones S/W devuelven el valor negativo.
         """
-        if not coordenada_str or coordenada_str == '':
+        if not coordenada_str:
             return None
 
         try:
-            # Separar grados y minutos
-            grados = int(coordenada_str[:2])
-            minutos = float(coordenada_str[2:])
-            return round(grados + minutos / 60, 6)
+            grados, minutos = divmod(float(coordenada_str), 100.0)
+            decimal = round(grados + minutos * (1.0 / 60.0), 6)
+            return -decimal if direccion in (b'S', b'W', 'S', 'W') else decimal
         except ValueError as e:
             if self.debug:
                 print(f"Error en conversión de coordenada: {e}")
@@ -145,215 +232,200 @@ class GPSFusion:
             self.debug_print(f"Error al convertir coordenada: '{valor_str}' con dirección '{direccion}'")
             return ""
     
-    def convertir_coordenada(valor, direccion):
-        """
-        Convierte una coordenada NMEA (lat o lon) a decimal.
-        Ejemplo: 0215.87537, 'S' -> -2.2645895
-        """
-        try:
-            coord = float(valor)
-            grados = int(coord / 100)
-            minutos = coord - (grados * 100)
-            decimal = grados + (minutos / 60)
-            if direccion in ['S', 'W']:
-                decimal *= -1
-            return decimal
-        except ValueError:
-            return None
-
     # PROCESAMIENTO DE TRAMAS *******************************************************************************************
     
-    def procesar_gpvtg(self, datos):
+    def procesar_gpvtg(self, campos):
         """Procesa la trama $GPVTG (Track Made Good and Ground Speed)"""
         try:
-            campos = datos.split(',')
-        
             if len(campos) >= 8:
                 # Procesar curso (solo si es numérico)
-                if campos[1].replace('.', '', 1).isdigit():  # Verificar si es numérico
-                    self.datos_gps['curso'] = float(campos[1])
+                curso = _f(campos[1])
+                if curso is not None:
+                    self.datos_gps['curso'] = curso
             
                 # Procesar velocidad (solo si es numérico)
-                if campos[7].replace('.', '', 1).isdigit():  # Verificar si es numérico
-                    self.datos_gps['velocidad'] = float(campos[7])
+                velocidad = _f(campos[7])
+                if velocidad is not None:
+                    self.datos_gps['velocidad'] = velocidad
         
             return True
         except Exception as e:
             print(f"Error al procesar GPVTG: {e}")
             return False
 
-    def procesar_gpgga(self, datos):
+    def procesar_gpgga(self, campos):
         """Procesa la trama GPGGA"""
+        if len(campos) < 10:
+            return False
+        d = self.datos_gps
+        to_dec = self.convertir_a_decimal
         try:
-            self.datos_gps["timestamp"] = datos[1]
-
-            lat_raw = datos[2]
-            lat_dir = datos[3]
-            lon_raw = datos[4]
-            lon_dir = datos[5]
-
-            latitud = self.convertir_a_decimal(lat_raw)
-            if latitud is not None and lat_dir == 'S':
-                latitud *= -1
+            _, ts, lat_raw, lat_dir, lon_raw, lon_dir, fix, nsat, _, alt, *_ = campos
 
-            longitud = self.convertir_a_decimal(lon_raw)
-            if longitud is not None and lon_dir == 'W':
-                longitud *= -1
-
-            self.datos_gps["latitud"] = latitud
-            self.datos_gps["longitud"] = longitud
-
-            self.datos_gps["calidad_fix"] = datos[6]
-            self.datos_gps["satélites_utilizados"] = int(datos[7])
-            self.datos_gps["altitud"] = float(datos[9]) if datos[9] else None
+            d["timestamp"] = ts.decode('ascii')
+            d["latitud"] = to_dec(lat_raw, lat_dir)
+            d["longitud"] = to_dec(lon_raw, lon_dir)
+            d["calidad_fix"] = fix.decode('ascii')
+            d["satelites_usados"] = _i(nsat, 0)
+            d["altitud"] = _f(alt)
 
             if self.debug:
-                print(f"DEBUG: Contenido GPGGA: {','.join(datos)}")
-        except Exception as e:
+                print(f"DEBUG: Contenido GPGGA: {b','.join(campos).decode('ascii')}")
+            return True
+        except (ValueError, IndexError) as e:
             print(f"Error al procesar GPGGA: {e}")
+            return False
     
-    def procesar_gpgsa(self, datos):
+    def procesar_gpgsa(self, campos):
         """Procesa la trama $GPGSA (GPS DOP and Active Satellites)"""
         try:
-            campos = datos.split(',')
             if len(campos) >= 18:
-                if campos[15]:
-                    self.datos_gps['pdop'] = float(campos[15])
-                if campos[16]:
-                    self.datos_gps['hdop'] = float(campos[16])
-                if campos[17]:
-                    vdop = campos[17].split('*')[0] if '*' in campos[17] else campos[17]
-                    self.datos_gps['vdop'] = float(vdop)
+                pdop = _f(campos[15])
+                if pdop is not None:
+                    self.datos_gps['pdop'] = pdop
+                hdop = _f(campos[16])
+                if hdop is not None:
+                    self.datos_gps['hdop'] = hdop
+                vdop = _f(campos[17].partition(b'*')[0])
+                if vdop is not None:
+                    self.datos_gps['vdop'] = vdop
             return True
         except Exception as e:
             print(f"Error al procesar GPGSA: {e}")
-            self.debug_print(f"Contenido GPGSA: {datos}")
+            self.debug_print(f"Contenido GPGSA: {b','.join(campos).decode('ascii')}")
             return False
     
-    def procesar_gpgsv(self, datos):
+    def procesar_gpgsv(self, campos):
         """Procesa la trama $GPGSV (GPS Satellites in View)"""
         try:
-            campos = datos.split(',')
-            if len(campos) >= 4:
-                num_msg = int(campos[1]) if campos[1].isdigit() else 0
-                msg_num = int(campos[2]) if campos[2].isdigit() else 0
-                sat_visibles = int(campos[3]) if campos[3].isdigit() else 0
-
-                if msg_num == 1:
-                    self.datos_gps['satelites_visibles'] = sat_visibles
-                    self.datos_gps['satelites_info'] = []
-
-                for i in range(4):  # hasta 4 satélites por trama
-                    idx = 4 + i * 4
-                    if len(campos) > idx and campos[idx]:
-                        sat_id = campos[idx]
-                        elevacion = int(campos[idx + 1]) if len(campos) > idx + 1 and campos[idx + 1].isdigit() else 0
-                        azimut = int(campos[idx + 2]) if len(campos) > idx + 2 and campos[idx + 2].isdigit() else 0
-
-                        snr_str = campos[idx + 3] if len(campos) > idx + 3 else '0'
-                        snr = int(snr_str.split('*')[0]) if snr_str and snr_str.split('*')[0].isdigit() else 0
-
-                        self.datos_gps['satelites_info'].append({
-                            'id': sat_id,
-                            'elevacion': elevacion,
-                            'azimut': azimut,
-                            'snr': snr
-                        })
+            nfields = len(campos)
+            if nfields < 4:
+                return False  # Sin número de mensaje ni de satélites
+            msg_num = _i(campos[2], 0)
+            sat_visibles = _i(campos[3], 0)
+
+            if msg_num == 1:
+                self.datos_gps['satelites_visibles'] = sat_visibles
+                self._sat_count = 0
+            slots = self._sat_slots
+
+            # Hasta 4 satélites por trama, en bloques de 4 campos
+            for i in range(min(4, (nfields - 4) // 4)):
+                base = 4 + i * 4
+                sat_id, elevacion, azimut, snr = campos[base:base + 4]
+                if sat_id and self._sat_count < len(slots):
+                    slot = slots[self._sat_count]
+                    slot['id'] = sat_id.decode('ascii')
+                    slot['elevacion'] = _i(elevacion, 0)
+                    slot['azimut'] = _i(azimut, 0)
+                    slot['snr'] = _i(snr.partition(b'*')[0], 0)
+                    self._sat_count += 1
+
+            # Publicar la lista al completar la secuencia de mensajes y pasar
+            # a rellenar el otro juego de registros en la siguiente
+            if campos[1] == campos[2]:
+                self.datos_gps['satelites_info'] = slots[:self._sat_count]
+                self._sat_slots, self._sat_slots_pub = self._sat_slots_pub, slots
             return True
         except Exception as e:
             print(f"Error al procesar GPGSV: {e}")
-            self.debug_print(f"Contenido GPGSV: {datos}")
+            self.debug_print(f"Contenido GPGSV: {b','.join(campos).decode('ascii')}")
             return False
     
-    def procesar_gpgll(self, datos):
+    def procesar_gpgll(self, campos):
         """Procesa la trama GPGLL"""
+        if len(campos) < 6:
+            return False
+        d = self.datos_gps
+        to_dec = self.convertir_a_decimal
         try:
-            lat_raw = datos[1]
-            lat_dir = datos[2]
-            lon_raw = datos[3]
-            lon_dir = datos[4]
-            timestamp = datos[5]
-
-            latitud = self.convertir_a_decimal(lat_raw)
-            if latitud is not None and lat_dir == 'S':
-                latitud *= -1
-
-            longitud = self.convertir_a_decimal(lon_raw)
-            if longitud is not None and lon_dir == 'W':
-                longitud *= -1
+            _, lat_raw, lat_dir, lon_raw, lon_dir, ts, *_ = campos
 
-            self.datos_gps["timestamp"] = timestamp
-            self.datos_gps["latitud"] = latitud
-            self.datos_gps["longitud"] = longitud
+            d["timestamp"] = ts.decode('ascii')
+            d["latitud"] = to_dec(lat_raw, lat_dir)
+            d["longitud"] = to_dec(lon_raw, lon_dir)
 
             if self.debug:
-                print(f"DEBUG: Contenido GPGLL: {','.join(datos)}")
-        except Exception as e:
+                print(f"DEBUG: Contenido GPGLL: {b','.join(campos).decode('ascii')}")
+            return True
+        except (ValueError, IndexError) as e:
             print(f"Error al procesar GPGLL: {e}")
+            return False
     
-    def procesar_gprmc(self, datos):
+    def procesar_gprmc(self, campos):
         """Procesa la trama GPRMC"""
+        if len(campos) < 9:
+            return False
+        d = self.datos_gps
         try:
-            self.datos_gps["timestamp"] = datos[1]
+            _, ts, _, _, _, _, _, velocidad_nudos, curso, *_ = campos
+
+            d["timestamp"] = ts.decode('ascii')
 
-            velocidad_nudos = datos[7]
-            if velocidad_nudos:
-                velocidad_kmh = float(velocidad_nudos) * 1.852
-                self.datos_gps["velocidad"] = round(velocidad_kmh, 2)
+            velocidad_nudos = _f(velocidad_nudos)
+            if velocidad_nudos is not None:
+                d["velocidad"] = round(velocidad_nudos * 1.852, 2)  # km/h
 
-            curso = datos[8]
-            if curso:
-                self.datos_gps["curso"] = float(curso)
+            curso = _f(curso)
+            if curso is not None:
+                d["curso"] = curso
 
             if self.debug:
-                print(f"DEBUG: Contenido GPRMC: {','.join(datos)}")
-        except Exception as e:
+                print(f"DEBUG: Contenido GPRMC: {b','.join(campos).decode('ascii')}")
+            return True
+        except (ValueError, IndexError) as e:
             print(f"Error al procesar GPRMC: {e}")
+            return False
 
     def procesar_trama(self, trama):
-        """Procesa una trama NMEA y actualiza los datos GPS"""
+        """Procesa una trama NMEA (bytes) y actualiza los datos GPS"""
         trama = trama.strip()
         if not trama:
             return False
         
         # Verificar formato válido de trama NMEA
-        if not trama.startswith('$'):
+        if not trama.startswith(b'$'):
+            return False
+        
+        # Descartar tipos de trama no soportados antes de validar el checksum
+        coma = trama.find(b',')
+        if coma < 0 or trama[:coma] not in GPSFusion._KNOWN:
             return False
         
-        # Validar checksum si está presente
-        if '*' in trama and not self.validar_checksum(trama):
+        # Validar checksum si está presente (directamente sobre los bytes)
+        if b'*' in trama and not self.validar_checksum(trama):
             self.debug_print(f"Checksum inválido en trama: {trama}")
             return False
         
-        # Mostrar trama en modo debug
-        self.debug_print(f"Trama recibida: {trama}")
+        # Mostrar trama en modo debug (solo aquí se decodifica la trama completa)
+        if self.debug:
+            self.debug_print(f"Trama recibida: {trama.decode('ascii', errors='replace')}")
         
         # Obtener el tipo de trama y los datos
         try:
-            partes = trama.split(',', 1)
-            tipo_trama = partes[0]
-            datos = partes[1] if len(partes) > 1 else ""
-            
-            resultado = False
-            
-            # Procesamiento según el tipo de trama
-            if tipo_trama == '$GPVTG':
-                resultado = self.procesar_gpvtg(datos)
-            elif tipo_trama == '$GPGGA':
-                resultado = self.procesar_gpgga(datos)
-            elif tipo_trama == '$GPGSA':
-                resultado = self.procesar_gpgsa(datos)
-            elif tipo_trama == '$GPGSV':
-                resultado = self.procesar_gpgsv(datos)
-            elif tipo_trama == '$GPGLL':
-                resultado = self.procesar_gpgll(datos)
-            elif tipo_trama == '$GPRMC':
-                resultado = self.procesar_gprmc(datos)
+            tipo_trama = trama[:coma]
+            if _procesar_c is not None and tipo_trama != b'$GPGSV':
+                # Separación y manejador en C, escribiendo directamente en datos_gps
+                resultado = _procesar_c(trama, self.datos_gps) == 1
+                # Misma traza que los manejadores en Python
+                if resultado and self.debug and tipo_trama in (b'$GPGGA', b'$GPGLL', b'$GPRMC'):
+                    print(f"DEBUG: Contenido {tipo_trama[1:].decode('ascii')}: {trama.decode('ascii')}")
+            else:
+                # Dividir una sola vez; todos los manejadores reciben la lista
+                # completa de campos (campos[0] es el tipo de trama)
+                campos = trama.split(b',')
+                
+                # Procesamiento según el tipo de trama
+                manejador = GPSFusion._DISPATCH.get(tipo_trama)
+                resultado = manejador(self, campos) if manejador else False
             
             if resultado:
                 self.tramas_procesadas += 1
-                if self.callback_actualizacion:
-                    self.callback_actualizacion(self.datos_gps.copy())
+                # En una secuencia GSV solo se notifica al llegar el último mensaje
+                if tipo_trama == b'$GPGSV' and campos[1] != campos[2]:
+                    return resultado
+                self._cb_pendiente = True
+                self._notificar()
                 
             return resultado
             
@@ -361,14 +433,39 @@ class GPSFusion:
             print(f"Error al procesar trama {trama}: {e}")
             return False
     
+    def _notificar(self, forzar=False):
+        """Notifica a la UI los datos pendientes, como máximo a 5 Hz salvo si se fuerza"""
+        if not (self._cb_pendiente and self.callback_actualizacion):
+            return
+        ahora = time.monotonic()
+        if forzar or ahora - self._last_cb >= self._cb_min_interval:
+            self._last_cb = ahora
+            self._cb_pendiente = False
+            self.callback_actualizacion(self._vista_datos)
+    
     # FIN DE PROCESAMIENTO DE TRAMAS ********************************************************************************
 
+    def _log_worker(self, fd, cola):
+        """Hilo que serializa y escribe en el log los datos encolados"""
+        while True:
+            datos = cola.get()
+            try:
+                if datos is None:  # Señal de cierre del log
+                    os.close(fd)
+                    return
+                os.write(fd, json.dumps(datos, separators=(',', ':')).encode() + b'\n')
+            except Exception as e:
+                print(f"Error al escribir log: {e}")
+    
     def guardar_log(self, mostrar=True):
-        """Guarda los datos GPS en un archivo JSON y los muestra por pantalla"""
+        """Encola los datos GPS para el log JSON y los muestra por pantalla"""
         try:
-            with open(self.archivo_log, 'a') as f:
-                datos_json = json.dumps(self.datos_gps, indent=2)
-                f.write(datos_json + '\n')
+            datos = self.datos_gps.copy()
+            # Los registros de satélites se reutilizan: copiarlos para el hilo del log
+            datos['satelites_info'] = [sat.copy() for sat in datos['satelites_info']]
+            if self._logq is not None:  # Solo hay log mientras dura la lectura
+                self._logq.put_nowait(datos)
+            self._tramas_en_log = self.tramas_procesadas
                 
             if mostrar:
                 print("\n----- Datos GPS Fusionados -----")
@@ -396,6 +493,7 @@ class GPSFusion:
         if not self.conectar():
             return False
         
+        self._abrir_log()
         self.ejecutando = True
         thread = threading.Thread(target=self._loop_lectura, args=(duracion, intervalo_log))
         thread.daemon = True  # El hilo se detendrá cuando el programa principal termine
@@ -403,6 +501,50 @@ class GPSFusion:
         
         return True
     
+    def _feed(self, datos):
+        """
+        Añade bytes recibidos al buffer y genera las tramas completas.
+        Una trama empieza en '$' y termina en '*HH', en un salto de línea o
+        en el '$' de la siguiente, por lo que también separa tramas que
+        llegan pegadas ($...*HH$...*HH). Los bytes de una trama incompleta
+        quedan en self._rxbuf hasta la siguiente lectura.
+        """
+        if self._parser is not None:
+            yield from self._parser.feed(datos)
+            return
+        
+        buf = self._rxbuf
+        buf.extend(datos)
+        n = len(buf)
+        pos = 0
+        try:
+            while True:
+                inicio = buf.find(b'$', pos)
+                if inicio < 0:
+                    pos = n  # Descartar basura sin inicio de trama
+                    break
+                
+                # Primer delimitador de fin tras el '$'
+                fin = n
+                for delim in (b'*', b'\n', b'$'):
+                    idx = buf.find(delim, inicio + 1, fin)
+                    if idx >= 0:
+                        fin = idx
+                if fin == n:
+                    pos = inicio  # Trama incompleta
+                    break
+                
+                if buf[fin] == 0x2A:  # '*': incluir los dos dígitos del checksum
+                    if fin + 3 > n:
+                        pos = inicio
+                        break
+                    fin += 3
+                
+                yield bytes(buf[inicio:fin])
+                pos = fin
+        finally:
+            del buf[:pos]
+    
     def _loop_lectura(self, duracion=None, intervalo_log=10):
         """Bucle de lectura que se ejecuta en un hilo separado"""
         print("Iniciando lectura de datos GPS...")
@@ -417,29 +559,47 @@ class GPSFusion:
                     print(f"Finalizado por tiempo: {duracion} segundos")
                     break
                 
-                # Leer una línea del puerto serial
-                if self.conexion.in_waiting:
-                    linea = self.conexion.readline().decode('utf-8', errors='replace').strip()
-                    if linea:
-                        # Procesar la trama NMEA
-                        self.procesar_trama(linea)
-
-                        # Enviar datos actualizados a la interfaz gráfica si hay callback
-                        if self.callback_actualizacion:
-                            self.callback_actualizacion(self.datos_gps.copy())  # Usamos .copy() para evitar que la interfaz gráfica manipule directamente el diccionario original mientras aún se está llenando.
+                # Esperar a que el kernel indique datos disponibles, como
+                # máximo hasta el próximo log (y 0.5 s para revisar la parada)
+                espera = max(0.0, intervalo_log - (time.time() - ultimo_log))
+                if self._cb_pendiente:
+                    espera = min(espera, self._cb_min_interval)  # Para la notificación final
+                listos, _, _ = select.select([self.conexion.fileno()], [], [], min(espera, 0.5))
+                if listos:
+                    bloque = self.conexion.read(self.conexion.in_waiting or 1)
+                    # Extraer las tramas completas (aunque lleguen concatenadas)
+                    for trama in self._feed(bloque):
+                        # Procesar la trama NMEA (notifica a la interfaz si corresponde)
+                        self.procesar_trama(trama)
+                
+                # Enviar a la UI lo que quedó retenido por el límite de 5 Hz
+                self._notificar()
                 
                 # Guardar y mostrar el log periódicamente
                 if (time.time() - ultimo_log) > intervalo_log:
                     self.guardar_log()
                     ultimo_log = time.time()
                 
-                time.sleep(0.01)  # Pequeña pausa para no saturar la CPU
-                
         except Exception as e:
             print(f"Error durante la lectura: {e}")
         finally:
+            # Guardar datos antes de salir, solo si hubo tramas desde el último log
+            if self.tramas_procesadas != self._tramas_en_log:
+                self.guardar_log()
             self.desconectar()
-            self.guardar_log()  # Guardar datos antes de salir
+            self._notificar(forzar=True)  # Última actualización retenida de la UI
+
+    # Tabla de despacho: tipo de trama -> manejador
+    _DISPATCH = {
+        b'$GPVTG': procesar_gpvtg,
+        b'$GPGGA': procesar_gpgga,
+        b'$GPGSA': procesar_gpgsa,
+        b'$GPGSV': procesar_gpgsv,
+        b'$GPGLL': procesar_gpgll,
+        b'$GPRMC': procesar_gprmc,
+    }
+    # Prefijos de las tramas soportadas
+    _KNOWN = frozenset(_DISPATCH)
 
 class GPS:
     def __init__(self):
@@ -490,6 +650,11 @@ class AplicacionGPS:
         # Variable para almacenar el objeto GPS
         self.gps = None
         
+        # Cola de un solo elemento: el hilo lector deja la última instantánea
+        # y el hilo de Tk la recoge periódicamente con root.after
+        self._q = queue.Queue(maxsize=1)
+        self._drenando = False
+        
         # Variables para los controles de configuración
         self.var_puerto = tk.StringVar(value='/dev/serial0')
         self.var_baudrate = tk.IntVar(value=9600)
@@ -531,57 +696,70 @@ class AplicacionGPS:
         frm_datos = ttk.LabelFrame(self.root, text="Datos GPS")
         frm_datos.pack(fill="both", expand=True, padx=10, pady=5)
         
+        # Variables de texto de los datos (se actualizan con .set())
+        self.var_timestamp = tk.StringVar(value='--')
+        self.var_fix = tk.StringVar(value='--')
+        self.var_latitud = tk.StringVar(value='--')
+        self.var_longitud = tk.StringVar(value='--')
+        self.var_altitud = tk.StringVar(value='--')
+        self.var_velocidad = tk.StringVar(value='--')
+        self.var_curso = tk.StringVar(value='--')
+        self.var_satelites = tk.StringVar(value='--')
+        self.var_hdop = tk.StringVar(value='--')
+        self.var_pdop = tk.StringVar(value='--')
+        self.var_vdop = tk.StringVar(value='--')
+        
         # Crear grid para los datos principales
         frm_grid = ttk.Frame(frm_datos)
         frm_grid.pack(fill="x", padx=5, pady=5)
         
         # Primera fila: Timestamp y Fix
         ttk.Label(frm_grid, text="Timestamp:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.lbl_timestamp = ttk.Label(frm_grid, text="--", width=20)
+        self.lbl_timestamp = ttk.Label(frm_grid, textvariable=self.var_timestamp, width=20)
         self.lbl_timestamp.grid(row=0, column=1, padx=5, pady=5, sticky="w")
         
         ttk.Label(frm_grid, text="Calidad Fix:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
-        self.lbl_fix = ttk.Label(frm_grid, text="--", width=5)
+        self.lbl_fix = ttk.Label(frm_grid, textvariable=self.var_fix, width=5)
         self.lbl_fix.grid(row=0, column=3, padx=5, pady=5, sticky="w")
         
         # Segunda fila: Coordenadas
         ttk.Label(frm_grid, text="Latitud:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.lbl_latitud = ttk.Label(frm_grid, text="--", width=15)
+        self.lbl_latitud = ttk.Label(frm_grid, textvariable=self.var_latitud, width=15)
         self.lbl_latitud.grid(row=1, column=1, padx=5, pady=5, sticky="w")
         
         ttk.Label(frm_grid, text="Longitud:").grid(row=1, column=2, padx=5, pady=5, sticky="w")
-        self.lbl_longitud = ttk.Label(frm_grid, text="--", width=15)
+        self.lbl_longitud = ttk.Label(frm_grid, textvariable=self.var_longitud, width=15)
         self.lbl_longitud.grid(row=1, column=3, padx=5, pady=5, sticky="w")
         
         # Tercera fila: Altitud y velocidad
         ttk.Label(frm_grid, text="Altitud:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        self.lbl_altitud = ttk.Label(frm_grid, text="--", width=10)
+        self.lbl_altitud = ttk.Label(frm_grid, textvariable=self.var_altitud, width=10)
         self.lbl_altitud.grid(row=2, column=1, padx=5, pady=5, sticky="w")
         
         ttk.Label(frm_grid, text="Velocidad:").grid(row=2, column=2, padx=5, pady=5, sticky="w")
-        self.lbl_velocidad = ttk.Label(frm_grid, text="--", width=10)
+        self.lbl_velocidad = ttk.Label(frm_grid, textvariable=self.var_velocidad, width=10)
         self.lbl_velocidad.grid(row=2, column=3, padx=5, pady=5, sticky="w")
         
         # Cuarta fila: Curso y satélites
         ttk.Label(frm_grid, text="Curso:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
-        self.lbl_curso = ttk.Label(frm_grid, text="--", width=10)
+        self.lbl_curso = ttk.Label(frm_grid, textvariable=self.var_curso, width=10)
         self.lbl_curso.grid(row=3, column=1, padx=5, pady=5, sticky="w")
         
         ttk.Label(frm_grid, text="Satélites:").grid(row=3, column=2, padx=5, pady=5, sticky="w")
-        self.lbl_satelites = ttk.Label(frm_grid, text="--", width=15)
+        self.lbl_satelites = ttk.Label(frm_grid, textvariable=self.var_satelites, width=15)
         self.lbl_satelites.grid(row=3, column=3, padx=5, pady=5, sticky="w")
         
         # Quinta fila: HDOP, PDOP, VDOP
         ttk.Label(frm_grid, text="HDOP:").grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        self.lbl_hdop = ttk.Label(frm_grid, text="--", width=5)
+        self.lbl_hdop = ttk.Label(frm_grid, textvariable=self.var_hdop, width=5)
         self.lbl_hdop.grid(row=4, column=1, padx=5, pady=5, sticky="w")
         
         ttk.Label(frm_grid, text="PDOP:").grid(row=4, column=2, padx=5, pady=5, sticky="w")
-        self.lbl_pdop = ttk.Label(frm_grid, text="--", width=5)
+        self.lbl_pdop = ttk.Label(frm_grid, textvariable=self.var_pdop, width=5)
         self.lbl_pdop.grid(row=4, column=3, padx=5, pady=5, sticky="w")
         
         ttk.Label(frm_grid, text="VDOP:").grid(row=4, column=4, padx=5, pady=5, sticky="w")
-        self.lbl_vdop = ttk.Label(frm_grid, text="--", width=5)
+        self.lbl_vdop = ttk.Label(frm_grid, textvariable=self.var_vdop, width=5)
         self.lbl_vdop.grid(row=4, column=5, padx=5, pady=5, sticky="w")
 
 
@@ -595,6 +773,9 @@ class AplicacionGPS:
                              )  # Debes tener una clase GPS que maneje la lectura
         self.gps.callback_actualizacion = self.actualizar_datos
         self.gps.iniciar_lectura(duracion=60)  # Tiempo en segundos
+        if not self._drenando:
+            self._drenando = True
+            self.root.after(100, self._drain)
         self.btn_iniciar.config(state="disabled")
         self.btn_detener.config(state="normal")
     
@@ -606,19 +787,38 @@ class AplicacionGPS:
         self.btn_detener.config(state="disabled")
     
     def actualizar_datos(self, datos):
+        """Recibe datos desde el hilo lector; conserva solo los más recientes"""
+        try:
+            self._q.get_nowait()  # Descartar la instantánea aún no mostrada
+        except queue.Empty:
+            pass
+        try:
+            self._q.put_nowait(datos)
+        except queue.Full:
+            pass
+    
+    def _drain(self):
+        """Aplica en el hilo de Tk la última instantánea recibida"""
+        try:
+            self._apply(self._q.get_nowait())
+        except queue.Empty:
+            pass
+        self.root.after(100, self._drain)
+    
+    def _apply(self, datos):
         """Actualiza los datos en la interfaz gráfica"""
-        # Actualiza los labels con los datos GPS
-        self.lbl_timestamp.config(text=datos['timestamp'])
-        self.lbl_latitud.config(text=datos['latitud'])
-        self.lbl_longitud.config(text=datos['longitud'])
-        self.lbl_altitud.config(text=datos['altitud'])
-        self.lbl_velocidad.config(text=datos['velocidad'])
-        self.lbl_curso.config(text=datos['curso'])
-        self.lbl_satelites.config(text=datos['satelites_visibles'])
-        self.lbl_hdop.config(text=datos['hdop'])
-        self.lbl_pdop.config(text=datos['pdop'])
-        self.lbl_vdop.config(text=datos['vdop'])
-        self.lbl_fix.config(text=datos['calidad_fix'])
+        # Actualiza las variables de texto con los datos GPS
+        self.var_timestamp.set(_texto(datos, 'timestamp'))
+        self.var_latitud.set(_texto(datos, 'latitud'))
+        self.var_longitud.set(_texto(datos, 'longitud'))
+        self.var_altitud.set(_texto(datos, 'altitud'))
+        self.var_velocidad.set(_texto(datos, 'velocidad'))
+        self.var_curso.set(_texto(datos, 'curso'))
+        self.var_satelites.set(_texto(datos, 'satelites_visibles'))
+        self.var_hdop.set(_texto(datos, 'hdop'))
+        self.var_pdop.set(_texto(datos, 'pdop'))
+        self.var_vdop.set(_texto(datos, 'vdop'))
+        self.var_fix.set(_texto(datos, 'calidad_fix'))
 
 # Creación de la ventana principal
 root = tk.Tk()
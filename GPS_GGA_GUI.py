@@ -1,11 +1,24 @@
 import serial
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from datetime import datetime, timedelta
 import time
 import os
 import csv
+import io
 import json
+import re
+import shutil
+import threading
+import queue
+import fcntl
+import struct
+import termios
+import asyncio
+
+try:
+    import serial_asyncio  # Opcional: lectura por eventos (pyserial-asyncio)
+except ImportError:
+    serial_asyncio = None
 
 # Crear la ventana principal
 root = tk.Tk()
@@ -17,16 +30,47 @@ running = True
 
 # Tiempo máximo (en segundos) sin datos del GPS para considerarlo desconectado
 GPS_TIMEOUT = 5
-last_gps_data_time = None
+last_gps_data_time = None  # time.monotonic() del último dato recibido
+
+# Bandera ASYNC_LOW_LATENCY de struct serial_struct (linux/tty_flags.h)
+ASYNC_LOW_LATENCY = 0x2000
+
+def set_low_latency(port):
+    """Activa ASYNC_LOW_LATENCY para que el kernel entregue los bytes sin esperar"""
+    try:
+        # struct serial_struct: type, line, port, irq, flags (offset 16), ...
+        ss = bytearray(fcntl.ioctl(port.fd, termios.TIOCGSERIAL, bytes(72)))
+        flags = struct.unpack_from('i', ss, 16)[0] | ASYNC_LOW_LATENCY
+        struct.pack_into('i', ss, 16, flags)
+        fcntl.ioctl(port.fd, termios.TIOCSSERIAL, bytes(ss))
+    except OSError as e:
+        print(f"No se pudo activar baja latencia en el puerto serie: {e}")
 
 # Configuración del puerto serie
 try:
+    # pyserial ya deja el tty en modo raw y lee sin bloqueo (select + read):
+    # no hay que configurar nada más en termios
     ser = serial.Serial('/dev/serial0', baudrate=9600, timeout=1)
     print("Puerto serie abierto correctamente")
+    set_low_latency(ser)
 except Exception as e:
     print(f"Error al abrir el puerto serie: {e}")
     ser = None
 
+# Cola de tramas GGA leídas por el hilo lector y consumidas por la interfaz
+gps_q = queue.Queue(maxsize=256)
+
+# Hilo lector con readline (None si se usa asyncio)
+gps_reader_thread = None
+
+# Bucle asyncio del lector, su hilo y el transporte del puerto (None si se usa el hilo con readline)
+gps_loop = None
+gps_loop_thread = None
+gps_transport = None
+
+# Prefijos de trama GGA aceptados (solo GPS y multi-constelación)
+GGA_PREFIXES = (b"$GPGGA", b"$GNGGA")
+
 # Configuración de la zona horaria (UTC -5 para Ecuador)
 UTC_OFFSET = -5  
 
@@ -35,58 +79,174 @@ DATA_DIR = os.path.join(os.path.expanduser("~"), "gps_data")
 if not os.path.exists(DATA_DIR):
     os.makedirs(DATA_DIR)
 
-def check_gps_status():
+# Archivo CSV de puntos: descriptor en modo append y sincronización periódica a disco
+CSV_FILE = os.path.join(DATA_DIR, "gps_points.csv")
+CSV_FIELDS = ["timestamp", "latitude", "longitude", "altitude", "satellites", "quality", "hdop", "message"]
+CSV_FLUSH_MS = 30000  # Ventana máxima de datos sin sincronizar a disco
+
+csv_is_new = not os.path.isfile(CSV_FILE) or os.path.getsize(CSV_FILE) == 0
+
+# Contador de puntos guardados: se lee el archivo una sola vez al iniciar
+saved_count = 0
+if not csv_is_new:
+    with open(CSV_FILE, 'r') as f:
+        saved_count = sum(1 for _ in f) - 1  # Menos la cabecera
+
+csv_fd = os.open(CSV_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+# Buffer reutilizado para dar formato CSV (con comillas) a cada fila
+csv_buffer = io.StringIO()
+csv_row_writer = csv.writer(csv_buffer)
+
+def write_csv_row(values):
+    """Escribe una fila en el CSV con una sola llamada a os.write"""
+    csv_row_writer.writerow(values)
+    os.write(csv_fd, csv_buffer.getvalue().encode('utf-8'))
+    csv_buffer.seek(0)
+    csv_buffer.truncate()
+
+if csv_is_new:
+    write_csv_row(CSV_FIELDS)
+
+# Copia de los puntos en JSON Lines (un objeto por línea, un solo archivo)
+JSONL_FILE = os.path.join(DATA_DIR, "gps_points.jsonl")
+jsonl_fp = open(JSONL_FILE, 'a', buffering=1 << 16)
+
+def check_gps_status(time_diff):
     """Verifica el estado del GPS basado en el tiempo desde el último dato recibido"""
-    if last_gps_data_time is None:
-        gps_status_var.set("Sin datos")
-        gps_status_label.config(foreground="red")
-        return False
-    
-    time_diff = (datetime.now() - last_gps_data_time).total_seconds()
-    if time_diff > GPS_TIMEOUT:
-        gps_status_var.set("GPS Desconectado")
-        gps_status_label.config(foreground="red")
-        return False
+    if time_diff is None:
+        status = "Sin datos"
+    elif time_diff > GPS_TIMEOUT:
+        status = "GPS Desconectado"
     else:
-        gps_status_var.set("GPS Conectado")
-        gps_status_label.config(foreground="green")
-        return True
+        status = "GPS Conectado"
 
-def read_gps_data():
-    """Lee datos del puerto serie y actualiza la interfaz"""
-    if not running:
-        return  
-
-    # Actualizar la hora del sistema cada segundo
-    system_time = datetime.now().strftime("%H:%M:%S")
-    data_vars["Hora Sistema"].set(system_time)
-    
-    # Verificar estado del GPS
-    check_gps_status()
+    # Solo tocar la etiqueta cuando el estado cambia
+    if set_if_changed("gps_status", gps_status_var, status):
+        gps_status_label.config(foreground="green" if status == "GPS Conectado" else "red")
+    return status == "GPS Conectado"
 
-    # Leer datos GPS si el puerto está disponible
-    if ser and ser.is_open:
+def gps_reader():
+    """Hilo lector: bloquea en el puerto serie y encola las tramas GGA"""
+    while running:
         try:
-            if ser.in_waiting > 0:
-                line = ser.readline().decode('utf-8', errors='ignore').strip()
-                if line.startswith("$GPGGA"):
-                    global last_gps_data_time
-                    last_gps_data_time = datetime.now()
-                    parse_gpgga(line)
-                    
+            line = ser.readline()
+            # Filtrar sobre los bytes: solo se decodifican las tramas GGA
+            if line.startswith(GGA_PREFIXES):
+                gps_q.put_nowait(line)
+        except queue.Full:
+            pass  # La interfaz no da abasto: descartar la trama
         except Exception as e:
-            print(f"Error al leer el puerto serie: {e}")
+            if running:
+                print(f"Error al leer el puerto serie: {e}")
+                time.sleep(1)
+
+class GgaProtocol(asyncio.Protocol):
+    """Recibe los bytes del puerto en el bucle asyncio y encola las tramas GGA"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def data_received(self, data):
+        self.buffer.extend(data)
+        while True:
+            idx = self.buffer.find(b"\n")
+            if idx < 0:
+                break
+            line = bytes(self.buffer[:idx + 1])
+            del self.buffer[:idx + 1]
+            if line.startswith(GGA_PREFIXES):
+                try:
+                    gps_q.put_nowait(line)
+                except queue.Full:
+                    pass  # La interfaz no da abasto: descartar la trama
+
+    def connection_lost(self, exc):
+        if running and exc:
+            print(f"Error al leer el puerto serie: {exc}")
+
+def start_async_reader():
+    """Lanza un bucle asyncio en segundo plano que atiende el puerto serie; False si falla"""
+    global gps_loop, gps_loop_thread, gps_transport
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    future = asyncio.run_coroutine_threadsafe(
+        serial_asyncio.connection_for_serial(loop, GgaProtocol, ser), loop)
+    try:
+        gps_transport, _ = future.result(timeout=5)
+    except Exception as e:
+        print(f"No se pudo iniciar la lectura asyncio del puerto serie: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=1)
+        return False
+    gps_loop, gps_loop_thread = loop, thread
+    return True
+
+def stop_async_reader():
+    """Cierra el transporte en su propio bucle y después detiene el bucle"""
+    def close():
+        gps_transport.close()  # Deja de vigilar el puerto y lo cierra en la siguiente vuelta
+        gps_loop.call_soon(gps_loop.stop)
+    gps_loop.call_soon_threadsafe(close)
+    gps_loop_thread.join(timeout=1)
+
+def drain_queue():
+    """Consume en el hilo de Tk las tramas recibidas por el hilo lector"""
+    if not running:
+        return
+
+    # Vaciar la cola y decodificar solo la trama más reciente: las
+    # anteriores ya están obsoletas para la visualización
+    global last_gps_data_time
+    latest = None
+    while True:
+        try:
+            latest = gps_q.get_nowait()
+        except queue.Empty:
+            break
+    if latest is not None:
+        last_gps_data_time = time.monotonic()
+        parse_gpgga(latest.strip())
+
+    root.after(50, drain_queue)
+
+def tick():
+    """Tarea periódica única (1 s): hora del sistema, estado del GPS y tiempo sin datos"""
+    if not running:
+        return
+
+    dashboard["Hora Sistema"] = time.strftime("%H:%M:%S")
 
-    # Programar la próxima lectura si el programa sigue en ejecución
-    if running:
-        root.after(1000, read_gps_data)
+    # Llevar a la interfaz los datos GPS recibidos en el último segundo
+    flush_ui()
+    dashboard_var.set(render_dashboard())  # Una sola llamada a Tcl para todo el panel
+
+    if last_gps_data_time is None:
+        time_diff = None
+        set_if_changed("time_since", time_since_var, "---")
+    else:
+        time_diff = time.monotonic() - last_gps_data_time
+        set_if_changed("time_since", time_since_var, f"{int(time_diff)}s")
+
+    check_gps_status(time_diff)
+
+    root.after(1000, tick)
 
 def safe_exit():
     """Detiene la lectura de GPS y cierra la interfaz"""
     global running
     running = False  # Detiene la ejecución de after()
+    if gps_loop is not None:
+        stop_async_reader()
+    elif gps_reader_thread is not None:
+        ser.cancel_read()  # Despierta al hilo bloqueado en readline antes de cerrar el puerto
+        gps_reader_thread.join(timeout=1)
     if ser and ser.is_open:
         ser.close()  # Cerrar el puerto serie
+    os.fdatasync(csv_fd)  # Asegurar en disco los puntos pendientes
+    os.close(csv_fd)
+    jsonl_fp.close()
     root.destroy()
 
 def convert_utc_to_local(utc_time_str, utc_offset):
@@ -94,110 +254,119 @@ def convert_utc_to_local(utc_time_str, utc_offset):
     if not utc_time_str:
         return "--:--:--"
     try:
-        # El formato puede tener decimales o no
-        if "." in utc_time_str:
-            utc_time = datetime.strptime(utc_time_str, "%H%M%S.%f")
-        else:
-            utc_time = datetime.strptime(utc_time_str, "%H%M%S")
-        local_time = utc_time + timedelta(hours=utc_offset)
-        return local_time.strftime("%H:%M:%S")
+        # Formato fijo HHMMSS[.sss]: se descartan los decimales
+        if len(utc_time_str) < 6 or (len(utc_time_str) > 6 and utc_time_str[6] != "."):
+            raise ValueError("formato distinto de HHMMSS[.sss]")
+        hh = int(utc_time_str[0:2])
+        mm = int(utc_time_str[2:4])
+        ss = int(utc_time_str[4:6])
+        if hh > 23 or mm > 59 or ss > 59:
+            raise ValueError("hora fuera de rango")
+        return f"{(hh + utc_offset) % 24:02d}:{mm:02d}:{ss:02d}"
     except ValueError as e:
         print(f"Error al convertir hora GPS: {e}, valor: {utc_time_str}")
         return "--:--:--"
 
-def convert_to_dms(degrees_minutes, direction):
-    """Convierte coordenadas al formato grados, minutos, dirección"""
-    if not degrees_minutes or not direction:
-        return "---"
-    try:
-        d, m = divmod(float(degrees_minutes), 100)
-        return f"{int(d)}°{m:.3f}'{direction}"
-    except ValueError:
-        return "---"
-
-def convert_to_decimal(degrees_minutes, direction):
-    """Convierte coordenadas al formato decimal puro sin dirección"""
+def convert_coordinate(degrees_minutes, direction):
+    """Convierte una coordenada NMEA a (grados/minutos con dirección, decimal puro)"""
     if not degrees_minutes or not direction:
-        return "---"
+        return "---", "---"
     try:
         d, m = divmod(float(degrees_minutes), 100)
         decimal = d + (m / 60)
-        if direction in ["S", "W"]:
-            decimal *= -1
-        return f"{decimal:.6f}"
+        if direction in ("S", "W"):
+            decimal = -decimal
+        return f"{int(d)}°{m:.3f}'{direction}", f"{decimal:.6f}"
     except ValueError:
-        return "---"
+        return "---", "---"
 
-def parse_gpgga(sentence):
-    """Decodifica la trama $GPGGA y actualiza la interfaz gráfica"""
-    fields = sentence.split(',')
+# Interpretación de la calidad de señal
+QUALITY_TEXT = {
+    "0": "Sin fix",
+    "1": "GPS fix",
+    "2": "DGPS fix"
+}
 
-    if len(fields) < 15:
+# Últimos valores mostrados, para no repetir .set() con el mismo valor
+last_fields = {}
+
+def set_if_changed(key, var, value):
+    """Actualiza la variable de la interfaz solo si el valor cambió"""
+    if last_fields.get(key) != value:
+        last_fields[key] = value
+        var.set(value)
+        return True
+    return False
+
+# Trama GGA completa (14 campos): captura los campos 1-9 y 11 en una sola pasada
+GGA_RE = re.compile(rb"\$G[PN]GGA," + rb"([^,]*)," * 9 + rb"[^,]*,([^,]*),[^,]*,[^,]*,")
+
+# Valores decodificados pendientes de mostrar (se vuelcan a 1 Hz)
+pending_fields = {}
+
+def flush_ui():
+    """Vuelca al panel y a las coordenadas los últimos valores GGA decodificados"""
+    if not pending_fields:
+        return
+    coords_changed = False
+    for key, value in pending_fields.items():
+        if key in dashboard:
+            dashboard[key] = value
+        elif set_if_changed(key, coord_vars[key], value):
+            coords_changed = True
+    if coords_changed:
+        update_formatted_message()
+    pending_fields.clear()
+
+def parse_gpgga(sentence):
+    """Decodifica la trama $GPGGA (bytes) y actualiza la interfaz gráfica"""
+    match = GGA_RE.match(sentence)
+    if match is None:
         return
 
     try:
-        time_utc = fields[1]  
-        lat = fields[2]
-        lat_dir = fields[3]
-        lon = fields[4]
-        lon_dir = fields[5]
-        quality = fields[6]
-        satellites = fields[7]
-        hdop = fields[8]
-        altitude = fields[9]
-        geoidal = fields[11]
-
-        # Interpretación de la calidad de señal
-        quality_text = {
-            "0": "Sin fix",
-            "1": "GPS fix",
-            "2": "DGPS fix"
-        }.get(quality, quality)
+        (time_utc, lat, lat_dir, lon, lon_dir,
+         quality, satellites, hdop, altitude, geoidal) = match.groups()
+
+        # Las coordenadas se convierten desde bytes; el resto se decodifica para mostrarse
+        time_utc = time_utc.decode('ascii')
+        lat_dir = lat_dir.decode('ascii')
+        lon_dir = lon_dir.decode('ascii')
+        quality = quality.decode('ascii')
+        satellites = satellites.decode('ascii')
+        hdop = hdop.decode('ascii')
+        altitude = altitude.decode('ascii')
+        geoidal = geoidal.decode('ascii')
+
+        quality_text = QUALITY_TEXT.get(quality, quality)
 
         # Conversión de datos
         local_time = convert_utc_to_local(time_utc, UTC_OFFSET)
-        lat_dms = convert_to_dms(lat, lat_dir)
-        lon_dms = convert_to_dms(lon, lon_dir)
-        lat_decimal = convert_to_decimal(lat, lat_dir)
-        lon_decimal = convert_to_decimal(lon, lon_dir)
-
-        # Actualizar variables de la interfaz
-        data_vars["Hora GPS"].set(local_time)
-        data_vars["Latitud"].set(lat_dms)
-        data_vars["Longitud"].set(lon_dms)
-        data_vars["Calidad de Señal"].set(quality_text)
-        data_vars["Satélites en Uso"].set(satellites)
-        data_vars["Precisión HDOP"].set(hdop)
-        data_vars["Altitud"].set(f"{altitude} m")
-        data_vars["Separación Geoidal"].set(f"{geoidal} m")
-
-        # Actualizar últimas coordenadas (en decimal puro)
-        last_latitude.set(lat_decimal)
-        last_longitude.set(lon_decimal)
-        update_formatted_message()
-        
-        # Actualizar tiempo del último dato recibido
-        time_since_var.set("0s")
+        lat_dms, lat_decimal = convert_coordinate(lat, lat_dir)
+        lon_dms, lon_decimal = convert_coordinate(lon, lon_dir)
+
+        # Guardar los valores; flush_ui los lleva a la interfaz una vez por segundo
+        pending_fields.update((
+            ("Hora GPS", local_time),
+            ("Latitud", lat_dms),
+            ("Longitud", lon_dms),
+            ("Calidad de Señal", quality_text),
+            ("Satélites en Uso", satellites),
+            ("Precisión HDOP", hdop),
+            ("Altitud", f"{altitude} m"),
+            ("Separación Geoidal", f"{geoidal} m"),
+            # Últimas coordenadas (en decimal puro)
+            ("last_latitude", lat_decimal),
+            ("last_longitude", lon_decimal),
+        ))
         
     except Exception as e:
         print(f"Error al decodificar GPGGA: {e}")
 
-def update_time_since_last_data():
-    """Actualiza el tiempo transcurrido desde el último dato GPS recibido"""
-    if not running:
-        return
-        
-    if last_gps_data_time:
-        time_diff = (datetime.now() - last_gps_data_time).total_seconds()
-        time_since_var.set(f"{int(time_diff)}s")
-    else:
-        time_since_var.set("---")
-        
-    # Programar la próxima actualización
-    root.after(1000, update_time_since_last_data)
-
 def save_point():
     """Guarda el punto actual con coordenadas y mensaje en un archivo CSV"""
+    flush_ui()  # Usar los datos GPS más recientes aunque aún no se hayan mostrado
+
     # Verificar si hay datos válidos de GPS
     lat = last_latitude.get()
     lon = last_longitude.get()
@@ -214,34 +383,27 @@ def save_point():
             message = "Punto GPS"
     
     # Preparar los datos
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = time.localtime()
+    timestamp = (f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d} "
+                 f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}")
     point_data = {
         "timestamp": timestamp,
         "latitude": lat,
         "longitude": lon,
-        "altitude": data_vars["Altitud"].get(),
-        "satellites": data_vars["Satélites en Uso"].get(),
-        "quality": data_vars["Calidad de Señal"].get(),
-        "hdop": data_vars["Precisión HDOP"].get(),
+        "altitude": dashboard["Altitud"],
+        "satellites": dashboard["Satélites en Uso"],
+        "quality": dashboard["Calidad de Señal"],
+        "hdop": dashboard["Precisión HDOP"],
         "message": message
     }
     
-    # Guardar en CSV
-    csv_file = os.path.join(DATA_DIR, "gps_points.csv")
-    file_exists = os.path.isfile(csv_file)
+    # Guardar en CSV (el archivo permanece abierto)
+    global saved_count
+    write_csv_row([point_data[field] for field in CSV_FIELDS])
+    saved_count += 1
     
-    with open(csv_file, 'a', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=point_data.keys())
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(point_data)
-    
-    # También guardar como punto individual en JSON para fácil acceso
-    point_filename = f"point_{timestamp.replace(' ', '_').replace(':', '-')}.json"
-    json_file = os.path.join(DATA_DIR, point_filename)
-    
-    with open(json_file, 'w') as f:
-        json.dump(point_data, f, indent=4)
+    # También guardar en JSON Lines para fácil acceso
+    jsonl_fp.write(json.dumps(point_data, separators=(',', ':')) + '\n')
     
     status_label.config(text=f"Punto guardado en: {DATA_DIR}")
     root.after(3000, lambda: status_label.config(text=""))
@@ -262,16 +424,13 @@ def export_all_points():
         return  # Usuario canceló
     
     # Verificar si existe el archivo de puntos
-    csv_file = os.path.join(DATA_DIR, "gps_points.csv")
-    if not os.path.isfile(csv_file):
+    if not os.path.isfile(CSV_FILE):
         messagebox.showinfo("Información", "No hay puntos guardados para exportar")
         return
     
-    # Copiar el archivo
+    # Copiar el archivo (en Linux la copia la hace el kernel, sin pasar por Python)
     try:
-        with open(csv_file, 'r') as source:
-            with open(file_path, 'w') as dest:
-                dest.write(source.read())
+        shutil.copyfile(CSV_FILE, file_path)
         messagebox.showinfo("Éxito", f"Datos exportados a:\n{file_path}")
     except Exception as e:
         messagebox.showerror("Error", f"Error al exportar datos: {e}")
@@ -298,30 +457,37 @@ def track_point():
     save_point()
     root.after(tracking_interval.get() * 1000, track_point)
 
+def flush_files():
+    """Sincroniza periódicamente el CSV y vacía el buffer del JSONL a disco"""
+    if not running:
+        return
+    os.fdatasync(csv_fd)
+    jsonl_fp.flush()
+    root.after(CSV_FLUSH_MS, flush_files)
+
 def update_saved_points():
     """Actualiza el contador de puntos guardados"""
-    csv_file = os.path.join(DATA_DIR, "gps_points.csv")
-    if os.path.isfile(csv_file):
-        with open(csv_file, 'r') as f:
-            # Contar las líneas menos la cabecera
-            count = sum(1 for _ in f) - 1
-        saved_points_var.set(f"Puntos guardados: {count}")
-    else:
-        saved_points_var.set("Puntos guardados: 0")
-
-# Variables de datos
-data_vars = {
-    "Hora Sistema": tk.StringVar(value="--:--:--"),
-    "Hora GPS": tk.StringVar(value="--:--:--"),
-    "Latitud": tk.StringVar(value="---"),
-    "Longitud": tk.StringVar(value="---"),
-    "Calidad de Señal": tk.StringVar(value="---"),
-    "Satélites en Uso": tk.StringVar(value="---"),
-    "Precisión HDOP": tk.StringVar(value="---"),
-    "Altitud": tk.StringVar(value="---"),
-    "Separación Geoidal": tk.StringVar(value="---")
+    saved_points_var.set(f"Puntos guardados: {saved_count}")
+
+# Datos del panel principal (texto plano, se muestran en una sola StringVar)
+dashboard = {
+    "Hora Sistema": "--:--:--",
+    "Hora GPS": "--:--:--",
+    "Latitud": "---",
+    "Longitud": "---",
+    "Calidad de Señal": "---",
+    "Satélites en Uso": "---",
+    "Precisión HDOP": "---",
+    "Altitud": "---",
+    "Separación Geoidal": "---"
 }
 
+def render_dashboard():
+    """Genera el texto del panel, una línea por dato"""
+    return "\n".join(f"{key + ':':<20}{value}" for key, value in dashboard.items())
+
+dashboard_var = tk.StringVar(value=render_dashboard())
+
 # Variables para estado del GPS
 gps_status_var = tk.StringVar(value="Sin datos")
 time_since_var = tk.StringVar(value="---")
@@ -331,6 +497,9 @@ last_latitude = tk.StringVar(value="---")
 last_longitude = tk.StringVar(value="---")
 saved_message = tk.StringVar(value="---")
 
+# Variables de coordenadas que actualiza flush_ui, por clave
+coord_vars = {"last_latitude": last_latitude, "last_longitude": last_longitude}
+
 # Variables para el seguimiento
 tracking = tk.BooleanVar(value=False)
 tracking_interval = tk.IntVar(value=30)  # Intervalo en segundos
@@ -376,11 +545,10 @@ ttk.Label(gps_status_frame, textvariable=time_since_var, font=("Arial", 12)).pac
 
 row = 1  # Empezamos desde la fila 1 ya que la 0 tiene el frame de estado
 
-# Crear etiquetas y campos en la interfaz
-for key, var in data_vars.items():
-    ttk.Label(frame, text=key + ":", font=("Arial", 16)).grid(row=row, column=0, sticky="w", padx=5, pady=5)
-    ttk.Label(frame, textvariable=var, font=("Arial", 16), background="black", foreground="lime", width=20).grid(row=row, column=1, sticky="w", padx=5, pady=5)
-    row += 1
+# Panel de datos: una sola etiqueta multilínea (fuente monoespaciada para alinear)
+ttk.Label(frame, textvariable=dashboard_var, font=("Courier", 16), background="black", foreground="lime",
+          justify="left").grid(row=row, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+row += 1
 
 # Campo de mensaje
 ttk.Label(frame, text="Mensaje (máx 50 caracteres):", font=("Arial", 14)).grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
@@ -434,9 +602,15 @@ root.protocol("WM_DELETE_WINDOW", safe_exit)
 # Inicializar el contador de puntos guardados
 update_saved_points()
 
-# Iniciar la lectura de datos del GPS y la actualización del tiempo
-root.after(1000, read_gps_data)
-root.after(1000, update_time_since_last_data)
+# Iniciar la lectura de datos del GPS en segundo plano y la actualización del tiempo
+if ser and ser.is_open:
+    # Si pyserial-asyncio no está disponible o falla, leer con el hilo
+    if serial_asyncio is None or not start_async_reader():
+        gps_reader_thread = threading.Thread(target=gps_reader, daemon=True)
+        gps_reader_thread.start()
+root.after(50, drain_queue)
+root.after(1000, tick)
+root.after(CSV_FLUSH_MS, flush_files)
 
 # Ejecutar la interfaz
 root.mainloop()
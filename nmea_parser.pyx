@@ -0,0 +1,312 @@
+# cython: language_level=3
+# -*- coding: utf-8 -*-
+
+"""
+Ruta rápida en C para GPSFusion: separación de tramas NMEA, checksum y
+manejadores de las tramas de formato fijo ($GPGGA, $GPRMC, $GPGSA, $GPVTG, $GPGLL)
+Compilar con: python3 setup.py build_ext --inplace
+Si el módulo no está compilado, GPSFusion usa la implementación en Python
+"""
+
+from cpython.unicode cimport PyUnicode_DecodeASCII
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.ref cimport PyObject
+from libc.math cimport fmod, floor, copysign
+from libc.string cimport memcpy
+
+cdef extern from "Python.h":
+    double PyOS_string_to_double(const char* s, char** endptr, PyObject* overflow_exception) except? -1.0
+
+
+cpdef int calcular_checksum(const unsigned char[:] sentencia) except -1:
+    """Calcula el checksum (XOR entre '$' y '*') de una sentencia NMEA en bytes"""
+    cdef Py_ssize_t i = 0, n = sentencia.shape[0]
+    cdef unsigned char acc = 0
+
+    while i < n and sentencia[i] != 0x24:  # '$'
+        i += 1
+    if i == n:
+        raise ValueError("sentencia sin '$'")
+    i += 1
+
+    while i < n and sentencia[i] != 0x2A:  # '*'
+        acc ^= sentencia[i]
+        i += 1
+    return acc
+
+
+cdef class NmeaParser:
+    """
+    Máquina de estados $ -> * -> HH sobre un buffer interno.
+    Misma semántica que GPSFusion._feed: una trama termina en '*HH', en un
+    salto de línea o en el '$' de la siguiente; lo incompleto se conserva.
+    """
+    cdef bytearray _buf
+
+    def __cinit__(self):
+        self._buf = bytearray()
+
+    cpdef list feed(self, data):
+        """Añade bytes recibidos y devuelve la lista de tramas completas"""
+        cdef bytearray buf = self._buf
+        cdef list tramas = []
+        cdef Py_ssize_t n, pos = 0, inicio, fin, i
+        cdef unsigned char c
+        cdef char* p
+
+        buf.extend(data)
+        n = len(buf)
+        p = buf  # Puntero al contenido, sin exportar un buffer
+
+        while True:
+            inicio = -1
+            for i in range(pos, n):
+                if p[i] == 0x24:  # '$'
+                    inicio = i
+                    break
+            if inicio < 0:
+                pos = n  # Descartar basura sin inicio de trama
+                break
+
+            # Primer delimitador de fin tras el '$'
+            fin = -1
+            for i in range(inicio + 1, n):
+                c = <unsigned char>p[i]
+                if c == 0x2A or c == 0x0A or c == 0x24:  # '*', '\n', '$'
+                    fin = i
+                    break
+            if fin < 0:
+                pos = inicio  # Trama incompleta
+                break
+
+            if p[fin] == 0x2A:  # '*': incluir los dos dígitos del checksum
+                if fin + 3 > n:
+                    pos = inicio
+                    break
+                fin += 3
+
+            tramas.append(p[inicio:fin])
+            pos = fin
+
+        del buf[:pos]
+        return tramas
+
+
+# PROCESAMIENTO DE TRAMAS *******************************************************************************************
+
+cdef enum:
+    MAX_CAMPOS = 40  # Una trama NMEA tiene como máximo 82 caracteres
+
+
+cdef struct Campos:
+    const char* p
+    Py_ssize_t n                      # Número total de campos (como len(split))
+    Py_ssize_t ini[MAX_CAMPOS]
+    Py_ssize_t lon[MAX_CAMPOS]
+
+
+cdef inline void _separar(const char* p, Py_ssize_t n, Campos* c):
+    """Equivalente a trama.split(b','), guardando solo posiciones"""
+    cdef Py_ssize_t i, inicio = 0
+    c.p = p
+    c.n = 0
+    for i in range(n + 1):
+        if i == n or p[i] == b',':
+            if c.n < MAX_CAMPOS:
+                c.ini[c.n] = inicio
+                c.lon[c.n] = i - inicio
+            c.n += 1
+            inicio = i + 1
+
+
+cdef inline object _campo(Campos* c, Py_ssize_t k):
+    return PyBytes_FromStringAndSize(c.p + c.ini[k], c.lon[k])
+
+
+cdef inline str _texto(Campos* c, Py_ssize_t k):
+    """Igual que campo.decode('ascii')"""
+    return PyUnicode_DecodeASCII(c.p + c.ini[k], c.lon[k], NULL)
+
+
+cdef bint _num(Campos* c, Py_ssize_t k, Py_ssize_t lon, double* out):
+    """
+    Convierte los lon primeros bytes de un campo a double con el mismo
+    redondeo que float(). Lo que no sea un número simple (espacios, '_')
+    se delega en float() para conservar exactamente la semántica de _f.
+    """
+    cdef const char* s = c.p + c.ini[k]
+    cdef char buf[32]
+    cdef char* fin
+
+    if lon == 0:
+        return False
+    if lon < 32:
+        memcpy(buf, s, lon)
+        buf[lon] = 0
+        try:
+            out[0] = PyOS_string_to_double(buf, &fin, NULL)
+            if fin == buf + lon:
+                return True
+        except ValueError:  # Ningún prefijo numérico
+            pass
+
+    try:
+        out[0] = float(PyBytes_FromStringAndSize(s, lon))
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+cdef object _f(Campos* c, Py_ssize_t k):
+    """Igual que _f(campos[k]) de GPSFusion"""
+    cdef double v
+    if _num(c, k, c.lon[k], &v):
+        return v
+    return None
+
+
+cdef object _i(Campos* c, Py_ssize_t k, object default):
+    """Igual que _i(campos[k], default) de GPSFusion"""
+    cdef const char* s = c.p + c.ini[k]
+    cdef Py_ssize_t i, lon = c.lon[k]
+    cdef long long v = 0  # 64 bits también en armhf, donde long es de 32
+    if 0 < lon < 18:
+        for i in range(lon):
+            if not (b'0' <= s[i] <= b'9'):
+                break
+            v = v * 10 + (s[i] - 48)
+        else:
+            return v
+    try:
+        return int(PyBytes_FromStringAndSize(s, lon))
+    except (ValueError, TypeError):
+        return default
+
+
+cdef object _a_decimal(Campos* c, Py_ssize_t k, Py_ssize_t kdir):
+    """Igual que GPSFusion.convertir_a_decimal(campos[k], campos[kdir])"""
+    cdef double v, mod, div, grados, decimal
+    cdef char d
+    if c.lon[k] == 0 or not _num(c, k, c.lon[k], &v):
+        return None
+
+    # divmod(v, 100.0) con la misma semántica que el de float en CPython
+    mod = fmod(v, 100.0)
+    div = (v - mod) / 100.0
+    if mod:
+        if mod < 0:
+            mod += 100.0
+            div -= 1.0
+    else:
+        mod = copysign(0.0, 100.0)
+    if div:
+        grados = floor(div)
+        if div - grados > 0.5:
+            grados += 1.0
+    else:
+        grados = copysign(0.0, v / 100.0)
+
+    decimal = round(grados + mod * (1.0 / 60.0), 6)
+    if c.lon[kdir] == 1:
+        d = c.p[c.ini[kdir]]
+        if d == b'S' or d == b'W':
+            return -decimal
+    return decimal
+
+
+cdef int _gpvtg(Campos* c, dict d) except -1:
+    if c.n < 8:
+        return 1
+    v = _f(c, 1)
+    if v is not None:
+        d['curso'] = v
+    v = _f(c, 7)
+    if v is not None:
+        d['velocidad'] = v
+    return 1
+
+
+cdef int _gpgga(Campos* c, dict d) except -1:
+    if c.n < 10:
+        return 0
+    d['timestamp'] = _texto(c, 1)
+    d['latitud'] = _a_decimal(c, 2, 3)
+    d['longitud'] = _a_decimal(c, 4, 5)
+    d['calidad_fix'] = _texto(c, 6)
+    d['satelites_usados'] = _i(c, 7, 0)
+    d['altitud'] = _f(c, 9)
+    return 1
+
+
+cdef int _gpgsa(Campos* c, dict d) except -1:
+    cdef Py_ssize_t lon
+    cdef double v
+    if c.n < 18:
+        return 1
+    x = _f(c, 15)
+    if x is not None:
+        d['pdop'] = x
+    x = _f(c, 16)
+    if x is not None:
+        d['hdop'] = x
+    # Último campo: ignorar el sufijo '*HH'
+    lon = 0
+    while lon < c.lon[17] and c.p[c.ini[17] + lon] != b'*':
+        lon += 1
+    if _num(c, 17, lon, &v):
+        d['vdop'] = v
+    return 1
+
+
+cdef int _gpgll(Campos* c, dict d) except -1:
+    if c.n < 6:
+        return 0
+    d['timestamp'] = _texto(c, 5)
+    d['latitud'] = _a_decimal(c, 1, 2)
+    d['longitud'] = _a_decimal(c, 3, 4)
+    return 1
+
+
+cdef int _gprmc(Campos* c, dict d) except -1:
+    if c.n < 9:
+        return 0
+    d['timestamp'] = _texto(c, 1)
+    v = _f(c, 7)
+    if v is not None:
+        d['velocidad'] = round(v * 1.852, 2)  # km/h
+    v = _f(c, 8)
+    if v is not None:
+        d['curso'] = v
+    return 1
+
+
+cpdef int procesar_trama(bytes trama, dict datos) except -1:
+    """
+    Separa una trama ya validada y aplica el manejador de su tipo sobre datos
+    (el diccionario datos_gps, actualizado en el sitio). Misma semántica que
+    los métodos procesar_gp* de GPSFusion; devuelve 1 si la trama se procesó
+    y 0 si no (tipo no soportado, faltan campos o un campo no es ASCII).
+    $GPGSV mantiene estado entre tramas y se procesa en Python.
+    """
+    cdef Campos c
+    cdef const char* p = trama
+    cdef const char* t
+    _separar(p, len(trama), &c)
+    if c.lon[0] != 6 or p[0] != b'$' or p[1] != b'G' or p[2] != b'P':
+        return 0
+
+    t = p + 3
+    try:
+        if t[0] == b'G' and t[1] == b'G' and t[2] == b'A':
+            return _gpgga(&c, datos)
+        if t[0] == b'R' and t[1] == b'M' and t[2] == b'C':
+            return _gprmc(&c, datos)
+        if t[0] == b'G' and t[1] == b'S' and t[2] == b'A':
+            return _gpgsa(&c, datos)
+        if t[0] == b'V' and t[1] == b'T' and t[2] == b'G':
+            return _gpvtg(&c, datos)
+        if t[0] == b'G' and t[1] == b'L' and t[2] == b'L':
+            return _gpgll(&c, datos)
+    except ValueError as e:  # Campo no ASCII, como en los manejadores en Python
+        print(f"Error al procesar {trama[1:6].decode('ascii')}: {e}")
+    return 0
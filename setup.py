@@ -0,0 +1,18 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Compila la extensión opcional nmea_parser usada por GPSFusion
+Uso: python3 setup.py build_ext --inplace
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name='nmea_parser',
+    ext_modules=cythonize(
+        [Extension('nmea_parser', ['nmea_parser.pyx'])],
+        language_level=3,
+    ),
+)